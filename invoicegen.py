@@ -6,23 +6,22 @@ graphical user interface (GUI) for users to input company details, customer info
 line items, and generate PDF invoices.
 
 Attributes:
-    company_name (tk.StringVar): The name of the company.
-    address (tk.StringVar): The address of the company.
-    city_st_zip (tk.StringVar): The city, state, and zip code of the company.
-    phone_no (tk.StringVar): The phone number of the company.
-    email (tk.StringVar): The email address of the company.
-    customer_name (tk.StringVar): The name of the customer.
-    customer_email (tk.StringVar): The email address of the customer.
-    customer_address (tk.StringVar): The address of the customer.
-    customer_city (tk.StringVar): The city of the customer.
+    _raw (dict): Raw config values for the entry fields (company_name, address, city_st_zip, phone_no,
+        email, customer_name, customer_email, customer_address, customer_city). Read them with _value().
+    company_name, address, city_st_zip, phone_no, customer_name (tk.StringVar): Created by _sv() from
+        _raw when their entry widget is built. Fields without an entry widget never get a tk.StringVar.
+    companyimage_file_name (str): The path of the company logo image, None if not set in the config file.
+    signature_file_name (str): The path of the signature image, None if not set in the config file.
     date (tk.StringVar): The date of the invoice.
-    authorized_signatory (str): The authorized signatory of the company.
-    line_items (list): A list of line items, each containing the date, description, location, and rate.
+    authorized_signatory (tk.StringVar): The authorized signatory of the company, shared with company_name.
+    line_items (list): A list of line items, each containing the date, description, location, and rate tk.Entry widgets.
 Methods:
     __init__(): Initializes the InvoiceGeneratorApp class.
     load_config(file_path): Loads configuration from a file and sets default values.
+    _sv(key): Gets the tk.StringVar for a field, creating it from the config value on first use.
+    _value(key): Gets the current value of a field without creating a tk.StringVar for it.
     create_widgets(): Creates the user interface widgets.
-    create_label_and_entry(label_text, text_variable, y_position): Creates a label and entry widget pair.
+    create_label_and_entry(label_text, key, y_position): Creates a label and entry widget pair.
     select_date(): Opens a calendar window for selecting a date.
     open_line_item_window(): Opens a window for entering line items.
     add_line_item_row(): Adds a new row for entering a line item.
@@ -31,6 +30,7 @@ Methods:
 
 # import required libraries
 import os
+import math
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkcalendar import Calendar
@@ -38,10 +38,291 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import cm
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import Color
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
 import webbrowser
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import datetime
 from datetime import timedelta
 import textwrap
+import tempfile
+
+# fixed A4 invoice layout, all coordinates in points
+PAGE_WIDTH, PAGE_HEIGHT = A4
+LEFT_X = 2 * cm
+RIGHT_X = PAGE_WIDTH - 2 * cm
+CENTER_X = PAGE_WIDTH / 2
+
+# header block
+LOGO_Y = PAGE_HEIGHT - 3.5 * cm
+LOGO_W = 4 * cm
+LOGO_H = 2 * cm
+COMPANY_YS = tuple(PAGE_HEIGHT - offset * cm for offset in (2, 2.5, 3, 3.5, 4))
+TITLE_Y = PAGE_HEIGHT - 5 * cm
+CUSTOMER_YS = tuple(PAGE_HEIGHT - offset * cm for offset in (5.5, 6, 6.5, 7))
+DATE_Y = CUSTOMER_YS[0]
+
+# line item table
+HEADER_RULE_Y = PAGE_HEIGHT - 8 * cm
+COLUMN_HEADER_Y = PAGE_HEIGHT - 8.5 * cm
+FIRST_ROW_Y = PAGE_HEIGHT - 9.5 * cm
+DESC_X = 5 * cm
+LOC_X = 12 * cm
+RATE_X = 17 * cm
+ROW_H = 1 * cm
+BAND_X = 1.8 * cm
+BAND_W = 17 * cm
+BAND_H = 0.7 * cm
+BAND_OFFSET = 0.2 * cm
+# keep a small gap so long values don't run into the next column
+DESC_MAX = (LOC_X - DESC_X) - 0.3 * cm
+LOC_MAX = (RATE_X - LOC_X) - 0.3 * cm
+
+# totals and footer, y offsets are measured down from the bottom of the table
+TOTAL_LABEL_X = PAGE_WIDTH - 6 * cm
+TOTAL_X = PAGE_WIDTH - 3 * cm
+TOTAL_DY = 1 * cm
+TOTAL_RULE_X = PAGE_WIDTH - 8 * cm
+TOTAL_RULE_DY = 1.5 * cm
+DUE_LABEL_X = PAGE_WIDTH - 5.7 * cm
+DUE_X = PAGE_WIDTH - 2.5 * cm
+DUE_DY = 2 * cm
+NOTE_X = 3 * cm
+NOTE_DY = 3 * cm
+NOTE_LINE_H = 0.5 * cm
+NOTE_WRAP_WIDTH = 90  # characters per line
+
+# signature block
+SIGNATORY_Y = 2 * cm
+SIGNATURE_X = PAGE_WIDTH - 6 * cm
+SIGNATURE_Y = 2.5 * cm
+SIGNATURE_W = 6 * cm
+SIGNATURE_H = 2 * cm
+
+# tracks the last issued invoice number
+INVOICE_NUMBER_FILE = "invoice_number.txt"
+
+# config keys for entry values, kept as raw strings until their entry widget is built
+STRINGVAR_KEYS = {
+    "company_name",
+    "address",
+    "city_st_zip",
+    "phone_no",
+    "email",
+    "customer_name",
+    "customer_email",
+    "customer_address",
+    "customer_city",
+}
+
+# config keys stored as plain strings (file paths)
+RAW_KEYS = {"companyimage_file_name", "signature_file_name"}
+
+def fit_text(text, max_width, font_name="Helvetica", font_size=10):
+    """
+        Truncate text with an ellipsis so it fits within max_width points.
+
+        Args:
+            text (str): The text to fit.
+            max_width (float): The available width in points.
+            font_name (str): The font the text is drawn in.
+            font_size (float): The font size the text is drawn in.
+        Returns:
+            str: The text, truncated if it doesn't fit.
+    """
+    if stringWidth(text, font_name, font_size) <= max_width:
+        return text
+
+    # binary search the longest prefix that fits alongside the ellipsis
+    ellipsis = "..."
+    available = max_width - stringWidth(ellipsis, font_name, font_size)
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if stringWidth(text[:mid], font_name, font_size) <= available:
+            low = mid
+        else:
+            high = mid - 1
+
+    return text[:low].rstrip() + ellipsis
+
+
+@functools.lru_cache(maxsize=None)
+def _image_reader(file_name):
+    """
+        Decode an image once per process, drawImage reuses the cached raster on every invoice.
+
+        Args:
+            file_name (str): The path of the image.
+        Returns:
+            ImageReader: The decoded image.
+    """
+    return ImageReader(file_name)
+
+
+def _build_pdf(snapshot, pdf_filename):
+    """
+        Draws the invoice contents from a snapshot of the entered information and saves the PDF.
+        Kept at module level so it can be pickled for worker processes.
+
+        Args:
+            snapshot (dict): Plain values of all invoice fields and line items.
+            pdf_filename (str): The path of the PDF to write.
+        Returns:
+            None
+    """
+    invoice_number = snapshot["invoice_number"]
+
+    # generate PDF to begin filling contents
+    inv_canvas = canvas.Canvas(pdf_filename, pagesize=A4, pageCompression=1, invariant=1)
+
+    # draw the logo at the top left
+    inv_canvas.drawImage(_image_reader(snapshot["companyimage_file_name"]), LEFT_X, LOGO_Y, width=LOGO_W, height=LOGO_H)
+
+    # company details next to the logo, right aligned in a single text object
+    company_lines = (snapshot["company_name"], snapshot["email"], snapshot["phone_no"], snapshot["address"], snapshot["city_st_zip"])
+    company_text = inv_canvas.beginText()
+    company_text.setFont("Helvetica", 10)
+    company_text.setFillGray(0.6)  # Set fill color to light gray
+    for company_y, line in zip(COMPANY_YS, company_lines):
+        company_text.setTextOrigin(RIGHT_X - stringWidth(line, "Helvetica", 10), company_y)
+        company_text.textOut(line)
+    inv_canvas.drawText(company_text)
+
+    inv_canvas.setFont("Helvetica", 20)
+    inv_canvas.setFillColorRGB(0, 0.6, 0.9)  # Set fill color to #00adeb
+    inv_canvas.drawCentredString(CENTER_X, TITLE_Y, "INVOICE")
+    inv_canvas.setFillColorRGB(0, 0, 0)  # Reset fill color to black
+
+    # invoice information
+    inv_canvas.setFont("Helvetica-Bold", 10)
+    inv_canvas.drawRightString(RIGHT_X, TITLE_Y, f"Invoice No.: {invoice_number}")
+    inv_canvas.setFont("Helvetica", 10)
+    inv_canvas.drawRightString(RIGHT_X, DATE_Y, snapshot["date"])
+
+    # client Information
+    customer_y1, customer_y2, customer_y3, customer_y4 = CUSTOMER_YS
+    inv_canvas.setFont("Helvetica-Bold", 10)
+    inv_canvas.drawString(LEFT_X, TITLE_Y, "BILL TO:")
+    inv_canvas.setFont("Helvetica", 10)
+    inv_canvas.drawString(LEFT_X, customer_y1, snapshot["customer_name"])
+    inv_canvas.drawString(LEFT_X, customer_y2, snapshot["customer_email"])
+    inv_canvas.drawString(LEFT_X, customer_y3, snapshot["customer_address"])
+    inv_canvas.drawString(LEFT_X, customer_y4, snapshot["customer_city"])
+
+    inv_canvas.setStrokeColorRGB(0.8, 0.8, 0.8)  # Set stroke color to light gray, used by every rule below
+    inv_canvas.line(LEFT_X, HEADER_RULE_Y, RIGHT_X, HEADER_RULE_Y)
+
+    inv_canvas.drawString(LEFT_X, COLUMN_HEADER_Y, "Date")
+    inv_canvas.drawString(DESC_X, COLUMN_HEADER_Y, "Description")
+    inv_canvas.drawString(LOC_X, COLUMN_HEADER_Y, "Location")
+    inv_canvas.drawString(RATE_X, COLUMN_HEADER_Y, "Rate")
+
+    # fsum avoids accumulating float rounding error across line items
+    subtotal = math.fsum(snapshot["rates"])
+
+    # y position of every line item row, computed once for the bands and the text
+    line_items = snapshot["line_items"]
+    row_ys = [FIRST_ROW_Y - index * ROW_H for index in range(len(line_items))]
+    # bottom of the table, where the totals start
+    y_position = FIRST_ROW_Y - len(line_items) * ROW_H
+
+    # print line items
+    # light grey color background for every other item for better readability
+    light_grey = Color(0.9, 0.9, 0.9)
+    black = Color(0, 0, 0)
+
+    # draw the background bands first so fill color changes don't interleave with the text,
+    # every odd row gets a light grey band
+    inv_canvas.setFillColor(light_grey)
+    for row_y in row_ys[1::2]:
+        inv_canvas.rect(BAND_X, row_y - BAND_OFFSET, BAND_W, BAND_H, fill=1, stroke=0)
+
+    # reset to default fill color (black) for text
+    inv_canvas.setFillColor(black)
+
+    # emit all line items through a single text object
+    rows_text = inv_canvas.beginText()
+    rows_text.setFont("Helvetica", 10)
+
+    for row_y, (date, description, location, rate) in zip(row_ys, line_items):
+        rows_text.setTextOrigin(LEFT_X, row_y)
+        rows_text.textOut(date)
+        rows_text.moveCursor(DESC_X - LEFT_X, 0)
+        rows_text.textOut(fit_text(description, DESC_MAX))
+        rows_text.moveCursor(LOC_X - DESC_X, 0)
+        rows_text.textOut(fit_text(location, LOC_MAX))
+        rows_text.moveCursor(RATE_X - LOC_X, 0)
+        rows_text.textOut("$" + rate)
+
+    inv_canvas.drawText(rows_text)
+
+    inv_canvas.line(LEFT_X, y_position, RIGHT_X, y_position)
+
+    # print total
+    total_y = y_position - TOTAL_DY
+    inv_canvas.drawRightString(TOTAL_LABEL_X, total_y, f"Total:")
+    inv_canvas.setFont("Helvetica-Bold", 12)
+    inv_canvas.setFillColorRGB(0, 0.6, 0.9)  # Set fill color to #00adeb
+    inv_canvas.drawRightString(TOTAL_X, total_y, f"$ {subtotal:.2f}")
+    inv_canvas.setFillColorRGB(0, 0, 0)  # Reset fill color to black
+
+    total_rule_y = y_position - TOTAL_RULE_DY
+    inv_canvas.line(TOTAL_RULE_X, total_rule_y, RIGHT_X, total_rule_y)
+
+    due_y = y_position - DUE_DY
+    inv_canvas.setFont("Helvetica-Bold", 10)
+    inv_canvas.drawRightString(DUE_LABEL_X, due_y, "Due Date:")
+    inv_canvas.setFont("Helvetica", 10)
+    inv_canvas.drawRightString(DUE_X, due_y, snapshot["due_date"])
+
+    # signature
+    inv_canvas.drawRightString(RIGHT_X, SIGNATORY_Y, f"Authorized Signatory: "+ snapshot["authorized_signatory"])
+    inv_canvas.drawImage(_image_reader(snapshot["signature_file_name"]), SIGNATURE_X, SIGNATURE_Y, width=SIGNATURE_W, height=SIGNATURE_H, mask='auto')
+
+    # add note to the invoice
+    inv_canvas.setFillColorRGB(0.5, 0.5, 0.5)  # Set fill color to light gray
+    note_text = f"Your business is greatly appreciated."
+
+    # short notes fit on one line, only wrap when needed
+    if len(note_text) <= NOTE_WRAP_WIDTH:
+        inv_canvas.drawString(NOTE_X, y_position - NOTE_DY, note_text)
+    else:
+        for line in textwrap.wrap(note_text, width=NOTE_WRAP_WIDTH):
+            inv_canvas.drawString(NOTE_X, y_position - NOTE_DY, line)
+            y_position -= NOTE_LINE_H
+
+    inv_canvas.showPage()
+    inv_canvas.save()
+
+
+def invoice_filename(invoice_number):
+    """
+        Get the path of the PDF for an invoice number.
+
+        Args:
+            invoice_number (int): The invoice number.
+        Returns:
+            str: The path of the invoice PDF.
+    """
+    return f"invoices/Invoice_{invoice_number}.pdf"
+
+
+def generate_batch(snapshots):
+    """
+        Generate several invoices in parallel, one worker process per CPU.
+
+        Args:
+            snapshots (list): Invoice snapshot dicts, with the keys generate_invoice passes to _build_pdf.
+        Returns:
+            list: The paths of the generated PDFs, in the order of snapshots.
+    """
+    pdf_filenames = [invoice_filename(snapshot["invoice_number"]) for snapshot in snapshots]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_build_pdf, snapshots, pdf_filenames))
+    return pdf_filenames
+
 
 class InvoiceGeneratorApp(tk.Tk):
     def __init__(self):
@@ -62,22 +343,22 @@ class InvoiceGeneratorApp(tk.Tk):
         # initialize variables via config file
         self.load_config("config.txt")
 
+        # single worker so invoices are built off the Tk main thread one at a time
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
         # set current date
         today = datetime.date.today()
         self.date = tk.StringVar(value=today.strftime("%d %B %Y"))
         self.due_date = (today + timedelta(days=15)).strftime("%d %B %Y")
 
         # assume authorized signatory is the company name (self)
-        self.authorized_signatory = self.company_name
+        self.authorized_signatory = self._sv("company_name")
 
         self.line_items = []  # To store each line item (Description, Qty, Unit Price, Total)
 
         # Create the UI
         self.create_widgets()
 
-        # verify the invoice number file exists
-        self.verify_invoice_number_file()
-
     def load_config(self, file_path):
         """
             Load configuration from a file and set default values.
@@ -88,6 +369,13 @@ class InvoiceGeneratorApp(tk.Tk):
             Returns:
                 None
         """
+        # raw values for entry fields, wrapped in tk.StringVar on first use
+        self._raw = {}
+
+        # image paths stay None if the config file doesn't set them
+        for key in RAW_KEYS:
+            setattr(self, key, None)
+
         # confirm filepath exists
         if not os.path.isfile(file_path):
             messagebox.showerror("Error", f"Configuration file not found: {file_path}")
@@ -95,32 +383,45 @@ class InvoiceGeneratorApp(tk.Tk):
 
         # read from config file to set default values
         with open(file_path, 'r') as file:
-            for line in file:
-                key, value = line.strip().split('=', 1)
-                value = value.strip()
-
-                if key == "companyimage_file_name":
-                    self.companyimage_file_name = value
-                elif key == "signature_file_name":
-                    self.signature_file_name = value
-                elif key == "company_name":
-                    self.company_name = tk.StringVar(value=value)
-                elif key == "address":
-                    self.address = tk.StringVar(value=value)
-                elif key == "city_st_zip":
-                    self.city_st_zip = tk.StringVar(value=value)
-                elif key == "phone_no":
-                    self.phone_no = tk.StringVar(value=value)
-                elif key == "email":
-                    self.email = tk.StringVar(value=value)
-                elif key == "customer_name":
-                    self.customer_name = tk.StringVar(value=value)
-                elif key == "customer_email":
-                    self.customer_email = tk.StringVar(value=value)
-                elif key == "customer_address":
-                    self.customer_address = tk.StringVar(value=value)
-                elif key == "customer_city":
-                    self.customer_city = tk.StringVar(value=value)
+            lines = file.read().splitlines()
+
+        for line in lines:
+            key, value = line.strip().split('=', 1)
+            value = value.strip()
+
+            if key in STRINGVAR_KEYS:
+                self._raw[key] = value
+            elif key in RAW_KEYS:
+                setattr(self, key, value)
+
+    def _sv(self, key):
+        """
+            Get the tk.StringVar for a field, creating it from the config value on first use.
+
+            Args:
+                key (str): The name of the field.
+            Returns:
+                tk.StringVar: The variable bound to the field.
+        """
+        text_variable = getattr(self, key, None)
+        if text_variable is None:
+            text_variable = tk.StringVar(value=self._raw.get(key, ""))
+            setattr(self, key, text_variable)
+        return text_variable
+
+    def _value(self, key):
+        """
+            Get the current value of a field without creating a tk.StringVar for it.
+
+            Args:
+                key (str): The name of the field.
+            Returns:
+                str: The entered value, or the config value if the field has no entry widget.
+        """
+        text_variable = getattr(self, key, None)
+        if text_variable is None:
+            return self._raw.get(key, "")
+        return text_variable.get()
 
     def create_widgets(self):
         """
@@ -136,12 +437,12 @@ class InvoiceGeneratorApp(tk.Tk):
         tk.Label(self, text="Company Details", font=("Arial", 20, "bold"), bg="white", fg="black").pack(pady=10)
 
         # create labels and entry widgets for inputting company details
-        self.create_label_and_entry("Company Name", self.company_name, 80)
-        self.create_label_and_entry("Address", self.address, 140)
-        self.create_label_and_entry("City", self.city_st_zip, 200)
-        self.create_label_and_entry("Phone No", self.phone_no, 380)
-        self.create_label_and_entry("Customer Name", self.customer_name, 440)
-        self.create_label_and_entry("Authorized Signatory", self.authorized_signatory, 500)
+        self.create_label_and_entry("Company Name", "company_name", 80)
+        self.create_label_and_entry("Address", "address", 140)
+        self.create_label_and_entry("City", "city_st_zip", 200)
+        self.create_label_and_entry("Phone No", "phone_no", 380)
+        self.create_label_and_entry("Customer Name", "customer_name", 440)
+        self.create_label_and_entry("Authorized Signatory", "authorized_signatory", 500)
 
         # client details
         tk.Label(self, text="Date", font=("Arial", 12), bg="white", fg="black").place(x=50, y=320)
@@ -152,15 +453,16 @@ class InvoiceGeneratorApp(tk.Tk):
         tk.Button(self, text="Enter Line Items", command=self.open_line_item_window, font=("Arial", 12), bg="black", fg="white").place(x=50, y=640, width=200, height=40)
 
         # button to generate invoice
-        tk.Button(self, text="Generate Invoice", command=self.generate_invoice, font=("Arial", 12), bg="black", fg="white").place(x=300, y=640, width=200, height=40)
+        self.generate_button = tk.Button(self, text="Generate Invoice", command=self.generate_invoice, font=("Arial", 12), bg="black", fg="white")
+        self.generate_button.place(x=300, y=640, width=200, height=40)
 
-    def create_label_and_entry(self, label_text, text_variable, y_position):
+    def create_label_and_entry(self, label_text, key, y_position):
         """
             Create a label and entry widget pair for inputting information.
 
             Args:
                 label_text (str): The text for the label.
-                text_variable (tk.StringVar): The variable to store the input value.
+                key (str): The name of the field storing the input value.
                 y_position (int): The y-position of the label and entry widgets.
             Returns:
                 None
@@ -168,7 +470,7 @@ class InvoiceGeneratorApp(tk.Tk):
 
         # create label and entry widgets
         tk.Label(self, text=label_text, font=("Arial", 12), bg="white", fg="black").place(x=50, y=y_position)
-        tk.Entry(self, textvariable=text_variable, font=("Arial", 12)).place(x=250, y=y_position, width=300, height=30)
+        tk.Entry(self, textvariable=self._sv(key), font=("Arial", 12)).place(x=250, y=y_position, width=300, height=30)
 
     def select_date(self):
         """
@@ -207,23 +509,38 @@ class InvoiceGeneratorApp(tk.Tk):
                 None
         """
 
+        # reuse the window if it was already built, its entries hold the line items entered so far
+        if getattr(self, "line_item_window", None) and self.line_item_window.winfo_exists():
+            self.line_item_window.deiconify()
+            self.line_item_window.lift()
+            return
+
         # create GUI window for entering line items
         self.line_item_window = tk.Toplevel(self)
         self.line_item_window.title("Line Items")
         self.line_item_window.geometry("800x600")
         self.line_item_window.configure(bg='white')
 
+        # hide instead of destroy on close, line item values live in the entry widgets
+        self.line_item_window.protocol("WM_DELETE_WINDOW", self.line_item_window.withdraw)
+
+        # entry rows are gridded in their own frame so adding a row doesn't re-layout the button
+        self._rows_frame = tk.Frame(self.line_item_window, bg='white')
+        self._rows_frame.pack()
+        self._btn_frame = tk.Frame(self.line_item_window, bg='white')
+        self._btn_frame.pack()
+
         # create labels for line items
-        tk.Label(self.line_item_window, text="Date", font=("Arial", 12), bg="white").grid(row=0, column=0, padx=10, pady=10)
-        tk.Label(self.line_item_window, text="Description", font=("Arial", 12), bg="white").grid(row=0, column=1, padx=10, pady=10)
-        tk.Label(self.line_item_window, text="Location", font=("Arial", 12), bg="white").grid(row=0, column=2, padx=10, pady=10)
-        tk.Label(self.line_item_window, text="Rate", font=("Arial", 12), bg="white").grid(row=0, column=3, padx=10, pady=10)
+        tk.Label(self._rows_frame, text="Date", font=("Arial", 12), bg="white").grid(row=0, column=0, padx=10, pady=10)
+        tk.Label(self._rows_frame, text="Description", font=("Arial", 12), bg="white").grid(row=0, column=1, padx=10, pady=10)
+        tk.Label(self._rows_frame, text="Location", font=("Arial", 12), bg="white").grid(row=0, column=2, padx=10, pady=10)
+        tk.Label(self._rows_frame, text="Rate", font=("Arial", 12), bg="white").grid(row=0, column=3, padx=10, pady=10)
 
         # add initial row for line item
         self.add_line_item_row()
 
         # button to add new line item row
-        tk.Button(self.line_item_window, text="+ Add Line", command=self.add_line_item_row, font=("Arial", 12), bg="black", fg="white").grid(row=999, column=0, columnspan=4, pady=20)
+        tk.Button(self._btn_frame, text="+ Add Line", command=self.add_line_item_row, font=("Arial", 12), bg="black", fg="white").pack(pady=20)
 
     def add_line_item_row(self):
         """
@@ -234,18 +551,19 @@ class InvoiceGeneratorApp(tk.Tk):
             Returns:
                 None
         """
-        # initialize variables for line item
+        # initialize row for line item
         row_index = len(self.line_items) + 1
-        date = tk.StringVar()
-        description = tk.StringVar()
-        location = tk.StringVar()
-        rate = tk.StringVar()
 
-        # create entry widgets for each line item
-        tk.Entry(self.line_item_window, textvariable=date, font=("Arial", 12), width=15).grid(row=row_index, column=0, padx=10, pady=10)
-        tk.Entry(self.line_item_window, textvariable=description, font=("Arial", 12), width=30).grid(row=row_index, column=1, padx=10, pady=10)
-        tk.Entry(self.line_item_window, textvariable=location, font=("Arial", 12), width=20).grid(row=row_index, column=2, padx=10, pady=10)
-        tk.Entry(self.line_item_window, textvariable=rate, font=("Arial", 12), width=10).grid(row=row_index, column=3, padx=10, pady=10)
+        # create entry widgets for each line item, values are read directly from the widgets
+        date = tk.Entry(self._rows_frame, font=("Arial", 12), width=15)
+        description = tk.Entry(self._rows_frame, font=("Arial", 12), width=30)
+        location = tk.Entry(self._rows_frame, font=("Arial", 12), width=20)
+        rate = tk.Entry(self._rows_frame, font=("Arial", 12), width=10)
+
+        date.grid(row=row_index, column=0, padx=10, pady=10)
+        description.grid(row=row_index, column=1, padx=10, pady=10)
+        location.grid(row=row_index, column=2, padx=10, pady=10)
+        rate.grid(row=row_index, column=3, padx=10, pady=10)
 
         # append line item to list
         self.line_items.append((date, description, location, rate))
@@ -261,161 +579,137 @@ class InvoiceGeneratorApp(tk.Tk):
         """
 
         # Check if all fields are filled, return error if not
-        if not self.company_name.get() or not self.address.get() or not self.city_st_zip.get() or not self.date.get() or not self.customer_name.get() or not self.phone_no.get() or not self.authorized_signatory.get():
+        if not self._value("company_name") or not self._value("address") or not self._value("city_st_zip") or not self.date.get() or not self._value("customer_name") or not self._value("phone_no") or not self.authorized_signatory.get():
             messagebox.showerror("Error", "Please fill in all fields.")
             return
 
-        # get next invoice number from file, or create file if it doesn't exist
-        invoice_number = self.get_next_invoice_number()
-        pdf_filename = f"invoices/Invoice_{invoice_number}.pdf"
-
-        # generate PDF to begin filling contents
-        inv_canvas = canvas.Canvas(pdf_filename, pagesize=A4)
-        width, height = A4
-
-        # draw the logo at the top left
-        inv_canvas.drawImage(self.companyimage_file_name, 2 * cm, height - 3.5 * cm, width=4 * cm, height=2 * cm)
-
-        # company details next to the logo
-        inv_canvas.setFont("Helvetica", 10)
-        inv_canvas.setFillColorRGB(0.6, 0.6, 0.6)  # Set fill color to light gray
-        inv_canvas.drawRightString(width - 2 * cm, height - 2 * cm, self.company_name.get())
-        inv_canvas.drawRightString(width - 2 * cm, height - 2.5 * cm, self.email.get())
-        inv_canvas.drawRightString(width - 2 * cm, height - 3 * cm, f"{self.phone_no.get()}")
-        inv_canvas.drawRightString(width - 2 * cm, height - 3.5 * cm, self.address.get())
-        inv_canvas.drawRightString(width - 2 * cm, height - 4 * cm, self.city_st_zip.get())
-        inv_canvas.setFillColorRGB(0, 0, 0)  # Reset fill color to black
-
-        inv_canvas.setFont("Helvetica", 20)
-        inv_canvas.setFillColorRGB(0, 0.6, 0.9)  # Set fill color to #00adeb
-        inv_canvas.drawCentredString(width / 2, height - 5 * cm, "INVOICE")
-        inv_canvas.setFillColorRGB(0, 0, 0)  # Reset fill color to black
-
-        # invoice information
-        inv_canvas.setFont("Helvetica-Bold", 10)
-        inv_canvas.drawRightString(width - 2 * cm, height - 5 * cm, f"Invoice No.: {invoice_number}")
-        inv_canvas.setFont("Helvetica", 10)
-        inv_canvas.drawRightString(width - 2 * cm, height - 5.5 * cm, f"{self.date.get()}")
-
-        # client Information
-        inv_canvas.setFont("Helvetica-Bold", 10)
-        inv_canvas.drawString(2 * cm, height - 5 * cm, "BILL TO:")
-        inv_canvas.setFont("Helvetica", 10)
-        inv_canvas.drawString(2 * cm, height - 5.5 * cm, f"{self.customer_name.get()}")
-        inv_canvas.drawString(2 * cm, height - 6 * cm, f"{self.customer_email.get()}")
-        inv_canvas.drawString(2 * cm, height - 6.5 * cm, f"{self.customer_address.get()}")
-        inv_canvas.drawString(2 * cm, height - 7 * cm, f"{self.customer_city.get()}")
-
-        inv_canvas.setStrokeColorRGB(0.8, 0.8, 0.8)  # Set stroke color to light gray
-        inv_canvas.line(2 * cm, height - 8 * cm, width - 2 * cm, height - 8 * cm)
-
-        inv_canvas.drawString(2 * cm, height - 8.5 * cm, "Date")
-        inv_canvas.drawString(5 * cm, height - 8.5 * cm, "Description")
-        inv_canvas.drawString(12 * cm, height - 8.5 * cm, "Location")
-        inv_canvas.drawString(17 * cm, height - 8.5 * cm, "Rate")
-
-        y_position = height - 9.5 * cm
-
-        subtotal : float = 0
-
-        # print line items
-        # light grey color background for every other item for better readability
-        light_grey = Color(0.9, 0.9, 0.9)
-
-        for index, item in enumerate(self.line_items):
-            date, description, location, rate = item
-
-            # check if the index is even to set the light grey background
-            if index % 2 != 0:
-                inv_canvas.setFillColor(light_grey)
-                inv_canvas.rect(1.8 * cm, y_position - 0.2 * cm, 17 * cm, .70 * cm, fill=1, stroke=0)
-
-            # reset to default fill color (black) for text
-            inv_canvas.setFillColor(Color(0, 0, 0))
-
-            inv_canvas.drawString(2 * cm, y_position, date.get())
-            inv_canvas.drawString(5 * cm, y_position, description.get())
-            inv_canvas.drawString(12 * cm, y_position, location.get())
-            inv_canvas.drawString(17 * cm, y_position, "$" + rate.get())
-
-            # increment totals
-            subtotal += float(rate.get())
-            
-            # update y position for next line item
-            y_position -= 1 * cm
-
-        inv_canvas.setStrokeColorRGB(0.8, 0.8, 0.8)  # Set stroke color to light gray
-        inv_canvas.line(2 * cm, y_position, width - 2 * cm, y_position)
-
-        # print total
-        inv_canvas.drawRightString(width - 6 * cm, y_position - 1 * cm, f"Total:")
-        inv_canvas.setFont("Helvetica-Bold", 12)
-        inv_canvas.setFillColorRGB(0, 0.6, 0.9)  # Set fill color to #00adeb
-        inv_canvas.drawRightString(width - 3 * cm, y_position - 1 * cm, f"$ {subtotal:.2f}")
-        inv_canvas.setFillColorRGB(0, 0, 0)  # Reset fill color to black
-
-        inv_canvas.setStrokeColorRGB(0.8, 0.8, 0.8)
-        inv_canvas.line(width - 8 * cm, y_position - 1.5 * cm, width - 2 * cm, y_position - 1.5 * cm)
-
-        inv_canvas.setFont("Helvetica", 10)
-        inv_canvas.setFont("Helvetica-Bold", 10)
-        inv_canvas.drawRightString(width - 5.7 * cm, y_position - 2 * cm, "Due Date:")
-        inv_canvas.setFont("Helvetica", 10)
-        inv_canvas.drawRightString(width - 2.5 * cm, y_position - 2 * cm, f"{self.due_date}")
-
-        # signature
-        inv_canvas.drawRightString(width - 2 * cm, 2 * cm, f"Authorized Signatory: "+ self.authorized_signatory.get())
-        inv_canvas.drawImage(self.signature_file_name, width - 6 * cm, 2.5 * cm, width=6 * cm, height=2 * cm, mask='auto')
-
-        # add note to the invoice
-        inv_canvas.setFillColorRGB(0.5, 0.5, 0.5)  # Set fill color to light gray
-        inv_canvas.setFont("Helvetica", 10)
-        note_text = f"Your business is greatly appreciated."
-
-        note_lines = textwrap.wrap(note_text, width=90)
-
-        for line in note_lines:
-            inv_canvas.drawString(3 * cm, y_position - 3 * cm, line)
-            y_position -= 0.5 * cm
-
-        inv_canvas.showPage()
-        inv_canvas.save()
+        # the logo and signature images can only come from the config file
+        if not self.companyimage_file_name or not self.signature_file_name:
+            messagebox.showerror("Error", "Please set companyimage_file_name and signature_file_name in config.txt.")
+            return
 
-        messagebox.showinfo("Success", f"Invoice generated successfully and saved as {pdf_filename}.")
+        # read line items once and parse rates before any drawing, a bad rate shouldn't abort a half-written PDF
+        rows = [tuple(field.get() for field in item) for item in self.line_items]
+        try:
+            rates = [float(row[3] or 0) for row in rows]
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a numeric rate for every line item.")
+            return
 
-        self.destroy()
+        # read every tk variable here, Tcl is not thread-safe so the worker only sees plain values
+        snapshot = {
+            "companyimage_file_name": self.companyimage_file_name,
+            "signature_file_name": self.signature_file_name,
+            "company_name": self._value("company_name"),
+            "address": self._value("address"),
+            "city_st_zip": self._value("city_st_zip"),
+            "phone_no": self._value("phone_no"),
+            "email": self._value("email"),
+            "customer_name": self._value("customer_name"),
+            "customer_email": self._value("customer_email"),
+            "customer_address": self._value("customer_address"),
+            "customer_city": self._value("customer_city"),
+            "date": self.date.get(),
+            "due_date": self.due_date,
+            "authorized_signatory": self.authorized_signatory.get(),
+            "line_items": rows,
+            "rates": rates,
+        }
+
+        # disable the button while the PDF builds, a second click would take another invoice number
+        self.generate_button.config(state="disabled")
+
+        try:
+            # get next invoice number from file, or create file if it doesn't exist
+            invoice_number = self.get_next_invoice_number()
+            pdf_filename = invoice_filename(invoice_number)
+            snapshot["invoice_number"] = invoice_number
+
+            # build the PDF off the Tk main thread to keep the window responsive
+            future = self._executor.submit(_build_pdf, snapshot, pdf_filename)
+            future.add_done_callback(lambda done: self._on_build_done(done, pdf_filename))
+        except Exception as e:
+            self._on_build_failed(f"Failed to generate invoice: {e}")
+
+    def _on_build_done(self, future, pdf_filename):
+        """
+            Posts the result of a background build back to the main thread.
+            May run on the worker thread or, if the build already finished, on the main thread,
+            so it only hands results over through self.after.
 
-        # Open the PDF in the default viewer
-        webbrowser.open(os.path.abspath(pdf_filename))
+            Args:
+                future (Future): The finished build.
+                pdf_filename (str): The path of the PDF that was written.
+            Returns:
+                None
+        """
+        error = future.exception()
+        if error is not None:
+            error_message = f"Failed to generate invoice: {error}"
+            self.after(0, lambda: self._on_build_failed(error_message))
+            return
+
+        self.after(0, lambda: self._on_invoice_built(pdf_filename))
 
-    def verify_invoice_number_file(self):
+    def _on_build_failed(self, error_message):
         """
-            verify the invoice number file exists.
+            Reports a failed build and re-enables the generate button. Runs on the main thread.
 
             Args:
+                error_message (str): The message to show the user.
+            Returns:
                 None
+        """
+        messagebox.showerror("Error", error_message)
+        self.generate_button.config(state="normal")
+
+    def _on_invoice_built(self, pdf_filename):
+        """
+            Notifies the user and opens the generated invoice. Runs on the main thread.
+
+            Args:
+                pdf_filename (str): The path of the generated PDF.
             Returns:
                 None
         """
-        if not os.path.exists("invoice_number.txt"):
-            with open("invoice_number.txt", "w") as f:
-                f.write("0")
+        messagebox.showinfo("Success", f"Invoice generated successfully and saved as {pdf_filename}.")
+
+        self.destroy()
+
+        # Open the PDF in the default viewer
+        webbrowser.open(os.path.abspath(pdf_filename))
 
     def get_next_invoice_number(self):
         """
             Get the next invoice number from the invoice number file.
+            The file is created if it doesn't exist, and replaced atomically so
+            an interrupted write never leaves a partial number behind.
+            Note: the read and write are not locked, so numbering is not safe when
+            several instances of the app run at the same time.
 
             Args:
                 None
             Returns:
                 int: The next invoice number.
         """
-        with open("invoice_number.txt", "r+") as f:
-            number = int(f.read().strip())
-            f.seek(0)
-            f.write(str(number + 1))
-        return number + 1
+        try:
+            with open(INVOICE_NUMBER_FILE, "r") as f:
+                number = int(f.read().strip() or 0)
+        except FileNotFoundError:
+            number = 0
+
+        # write to a unique temp file then swap it in, this also truncates shorter numbers
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(INVOICE_NUMBER_FILE)))
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(str(number + 1))
+            os.replace(tmp_file, INVOICE_NUMBER_FILE)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
 
+        return number + 1
 
 if __name__ == "__main__":
     app = InvoiceGeneratorApp()